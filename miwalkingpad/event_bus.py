@@ -1,30 +1,66 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import AsyncIterator
+from time import time
+
+from miwalkingpad.types.events import DroppedEventsEvent
+
+
+class _Subscription:
+    """Bounded ring buffer of pending events plus a wake-up signal for one stream."""
+
+    __slots__ = ("dropped", "events", "ready")
+
+    def __init__(self, maxlen: int) -> None:
+        self.events: deque[object] = deque(maxlen=maxlen)
+        self.ready = asyncio.Event()
+        self.dropped = 0
 
 
 class AsyncEventBus:
-    """Simple fan-out async event bus using per-subscriber queues."""
+    """Simple fan-out async event bus using bounded per-subscriber ring buffers.
 
-    def __init__(self) -> None:
-        self._subscribers: set[asyncio.Queue[object]] = set()
-        self._lock = asyncio.Lock()
+    When a subscriber falls behind, its oldest pending event is dropped so memory
+    stays bounded and the newest events (for example status updates) are kept. The
+    stream reports each run of losses as one `DroppedEventsEvent` before resuming.
+    """
+
+    def __init__(self, max_queue_size: int = 1024) -> None:
+        # publish() never awaits while iterating, so subscribe/unsubscribe cannot
+        # interleave with a fan-out on the event loop; no copy or lock is needed.
+        self._subscribers: list[_Subscription] = []
+        self._max_queue_size = max_queue_size
 
     async def publish(self, event: object) -> None:
-        async with self._lock:
-            subscribers = tuple(self._subscribers)
-        for queue in subscribers:
-            queue.put_nowait(event)
+        for subscription in self._subscribers:
+            events = subscription.events
+            if len(events) == events.maxlen:
+                subscription.dropped += 1
+            events.append(event)
+            subscription.ready.set()
+
+    def has_subscribers(self) -> bool:
+        """Return True if any stream is listening; lets publishers skip building events."""
+        return bool(self._subscribers)
+
+    def pressure(self) -> int:
+        """Return the backlog of the most lagging subscriber (0 when all are drained)."""
+        return max((len(subscription.events) for subscription in self._subscribers), default=0)
 
     async def stream(self) -> AsyncIterator[object]:
-        queue: asyncio.Queue[object] = asyncio.Queue()
-        async with self._lock:
-            self._subscribers.add(queue)
+        subscription = _Subscription(self._max_queue_size)
+        self._subscribers.append(subscription)
         try:
             while True:
-                yield await queue.get()
+                if not subscription.events:
+                    subscription.ready.clear()
+                    await subscription.ready.wait()
+                    continue
+                if subscription.dropped:
+                    count, subscription.dropped = subscription.dropped, 0
+                    yield DroppedEventsEvent(timestamp=time(), count=count)
+                yield subscription.events.popleft()
         finally:
-            async with self._lock:
-                self._subscribers.discard(queue)
-
+            self._subscribers.remove(subscription)
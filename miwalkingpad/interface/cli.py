@@ -2,143 +2,130 @@ from __future__ import annotations
 
 import asyncio
 import json
-from dataclasses import asdict
-from datetime import timedelta
+from collections.abc import Coroutine
 
 import typer
 
 from miwalkingpad.discovery import discover_handshake
 from miwalkingpad.interface.config import load_optional_token
-from miwalkingpad.interface.factory import create_service
-from miwalkingpad.types.models import PadMode, PadSensitivity, PadStatus
+from miwalkingpad.interface.factory import get_service, reset_service
+from miwalkingpad.service import AsyncWalkingPadService
+from miwalkingpad.types.models import CommandResult, PadMode, PadSensitivity, PadStatus
 from miwalkingpad.interface.tui import WalkingPadTuiApp
 
+try:  # Optional faster event loop: `pip install 'py-miwalkingpad[speedups]'`.
+    from uvloop import new_event_loop as _loop_factory  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        from winloop import new_event_loop as _loop_factory  # type: ignore[import-not-found]
+    except ImportError:
+        _loop_factory = None
+
 app = typer.Typer(help="WalkingPad CLI")
 
+_runner: asyncio.Runner | None = None
+
+
+def _run[T](coro: Coroutine[object, object, T]) -> T:
+    """Run a coroutine on one event loop reused by every command in this process."""
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner(loop_factory=_loop_factory)
+    return _runner.run(coro)
+
+
+def close_runner() -> None:
+    """Close the shared service and event loop; called once the CLI entry point returns."""
+    global _runner
+    if _runner is not None:
+        _runner.run(reset_service())
+        _runner.close()
+        _runner = None
+
+
+def _service() -> AsyncWalkingPadService:
+    return get_service()[1]
+
+
+def _echo_result(result: CommandResult) -> None:
+    typer.echo(result.message)
+
 
 def _status_to_dict(status: PadStatus) -> dict[str, object]:
-    data = asdict(status)
-    wt = data.get("walking_time")
-    if isinstance(wt, timedelta):
-        data["walking_time"] = int(wt.total_seconds())
-    data["mode"] = status.mode.value if status.mode else None
-    data["sensitivity"] = status.sensitivity.value if status.sensitivity else None
-    return data
+    walking_time = status.walking_time
+    return {
+        "is_on": status.is_on,
+        "power": status.power,
+        "mode": status.mode.value if status.mode else None,
+        "speed_kmh": status.speed_kmh,
+        "start_speed_kmh": status.start_speed_kmh,
+        "sensitivity": status.sensitivity.value if status.sensitivity else None,
+        "step_count": status.step_count,
+        "distance_m": status.distance_m,
+        "calories": status.calories,
+        "walking_time": int(walking_time.total_seconds()) if walking_time is not None else None,
+    }
 
 
 @app.command("status")
 def status(quick: bool = typer.Option(False, "--quick", help="Use quick status read")) -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.get_status(quick=quick)
-        typer.echo(json.dumps(_status_to_dict(result), indent=2))
-
-    asyncio.run(_run())
+    result = _run(_service().get_status(quick=quick))
+    typer.echo(json.dumps(_status_to_dict(result), indent=2))
 
 
 @app.command("start")
 def start() -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.start()
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().start()))
 
 
 @app.command("stop")
 def stop() -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.stop()
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().stop()))
 
 
 @app.command("power-on")
 def power_on() -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.power_on()
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().power_on()))
 
 
 @app.command("power-off")
 def power_off() -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.power_off()
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().power_off()))
 
 
 @app.command("lock")
 def lock() -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.lock()
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().lock()))
 
 
 @app.command("unlock")
 def unlock() -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.unlock()
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().unlock()))
 
 
 @app.command("set-speed")
 def set_speed(speed: float = typer.Argument(..., help="Speed in km/h (0..6)")) -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.set_speed(speed)
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().set_speed(speed)))
 
 
 @app.command("set-start-speed")
 def set_start_speed(speed: float = typer.Argument(..., help="Start speed in km/h (0..6)")) -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.set_start_speed(speed)
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().set_start_speed(speed)))
 
 
 @app.command("set-mode")
 def set_mode(mode: PadMode = typer.Argument(..., help="auto|manual|off")) -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.set_mode(mode)
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().set_mode(mode)))
 
 
 @app.command("set-sensitivity")
 def set_sensitivity(sensitivity: PadSensitivity = typer.Argument(..., help="high|medium|low")) -> None:
-    async def _run() -> None:
-        _, service = create_service()
-        result = await service.set_sensitivity(sensitivity)
-        typer.echo(result.message)
-
-    asyncio.run(_run())
+    _echo_result(_run(_service().set_sensitivity(sensitivity)))
 
 
 @app.command("tui")
 def tui() -> None:
-    WalkingPadTuiApp(create_service).run()
+    WalkingPadTuiApp(get_service).run()
 
 
 @app.command("discover")
@@ -2,29 +2,63 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
 from miwalkingpad.types.errors import ConfigurationError
 
+_DOTENV_LOADED = False
 
-@dataclass(slots=True)
+
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     walkingpad_ip: str
     walkingpad_token: str
     walkingpad_model: str = "ksmb.walkingpad.v1"
     polling_interval_seconds: float = 1.0
     request_timeout_seconds: float = 5.0
+    polling_interval_min_seconds: float | None = None
+    polling_interval_max_seconds: float | None = None
+
+
+def _load_dotenv_once() -> None:
+    """Parse `.env` into the process environment only on first use."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
 
 
 def load_config() -> AppConfig:
-    load_dotenv()
+    _load_dotenv_once()
+
+    environ = os.environ
+    # Raw values form the cache key, so env changes still produce a fresh config.
+    return _build_config(
+        environ.get("WALKINGPAD_IP", ""),
+        environ.get("WALKINGPAD_TOKEN", ""),
+        environ.get("WALKINGPAD_MODEL", ""),
+        environ.get("WALKINGPAD_POLLING_INTERVAL", ""),
+        environ.get("WALKINGPAD_REQUEST_TIMEOUT", ""),
+        environ.get("WALKINGPAD_POLLING_INTERVAL_MIN", ""),
+        environ.get("WALKINGPAD_POLLING_INTERVAL_MAX", ""),
+    )
+
 
-    ip = os.getenv("WALKINGPAD_IP", "").strip()
-    token = os.getenv("WALKINGPAD_TOKEN", "").strip()
-    model = os.getenv("WALKINGPAD_MODEL", "ksmb.walkingpad.v1").strip() or "ksmb.walkingpad.v1"
-    polling_interval_raw = os.getenv("WALKINGPAD_POLLING_INTERVAL", "1.0").strip() or "1.0"
-    request_timeout_raw = os.getenv("WALKINGPAD_REQUEST_TIMEOUT", "5.0").strip() or "5.0"
+@lru_cache(maxsize=1)
+def _build_config(
+    ip_raw: str,
+    token_raw: str,
+    model_raw: str,
+    polling_interval_raw: str,
+    request_timeout_raw: str,
+    polling_interval_min_raw: str,
+    polling_interval_max_raw: str,
+) -> AppConfig:
+    ip = ip_raw.strip()
+    token = token_raw.strip()
+    model = model_raw.strip() or "ksmb.walkingpad.v1"
 
     missing: list[str] = []
     if not ip:
@@ -34,21 +68,25 @@ def load_config() -> AppConfig:
     if missing:
         raise ConfigurationError(f"Missing required environment variables: {', '.join(missing)}")
 
-    try:
-        polling_interval = float(polling_interval_raw)
-    except ValueError as exc:
-        raise ConfigurationError("WALKINGPAD_POLLING_INTERVAL must be a number") from exc
-
-    if polling_interval <= 0:
-        raise ConfigurationError("WALKINGPAD_POLLING_INTERVAL must be > 0")
-
-    try:
-        request_timeout = float(request_timeout_raw)
-    except ValueError as exc:
-        raise ConfigurationError("WALKINGPAD_REQUEST_TIMEOUT must be a number") from exc
+    polling_interval = (
+        _parse_positive_float("WALKINGPAD_POLLING_INTERVAL", polling_interval_raw) or 1.0
+    )
+    request_timeout = (
+        _parse_positive_float("WALKINGPAD_REQUEST_TIMEOUT", request_timeout_raw) or 5.0
+    )
+    polling_interval_min = _parse_positive_float(
+        "WALKINGPAD_POLLING_INTERVAL_MIN", polling_interval_min_raw
+    )
+    polling_interval_max = _parse_positive_float(
+        "WALKINGPAD_POLLING_INTERVAL_MAX", polling_interval_max_raw
+    )
 
-    if request_timeout <= 0:
-        raise ConfigurationError("WALKINGPAD_REQUEST_TIMEOUT must be > 0")
+    effective_min = polling_interval_min or polling_interval
+    if polling_interval_max is not None and effective_min > polling_interval_max:
+        raise ConfigurationError(
+            "WALKINGPAD_POLLING_INTERVAL_MIN (default: WALKINGPAD_POLLING_INTERVAL) "
+            "must be <= WALKINGPAD_POLLING_INTERVAL_MAX"
+        )
 
     return AppConfig(
         walkingpad_ip=ip,
@@ -56,11 +94,27 @@ def load_config() -> AppConfig:
         walkingpad_model=model,
         polling_interval_seconds=polling_interval,
         request_timeout_seconds=request_timeout,
+        polling_interval_min_seconds=polling_interval_min,
+        polling_interval_max_seconds=polling_interval_max,
     )
 
 
+def _parse_positive_float(name: str, raw: str) -> float | None:
+    """Parse a positive number setting; blank values yield None."""
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError as exc:
+        raise ConfigurationError(f"{name} must be a number") from exc
+    if value <= 0:
+        raise ConfigurationError(f"{name} must be > 0")
+    return value
+
+
 def load_optional_token() -> str | None:
     """Load WALKINGPAD_TOKEN from .env/env without requiring other config fields."""
-    load_dotenv()
-    token = os.getenv("WALKINGPAD_TOKEN", "").strip()
+    _load_dotenv_once()
+    token = os.environ.get("WALKINGPAD_TOKEN", "").strip()
     return token or None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from miwalkingpad.event_bus import AsyncEventBus
 from miwalkingpad.service import AsyncWalkingPadService
 from miwalkingpad.interface.config import AppConfig, load_config
@@ -17,3 +19,17 @@ def create_service(config: AppConfig | None = None) -> tuple[AppConfig, AsyncWal
     service = AsyncWalkingPadService(adapter=adapter, event_bus=AsyncEventBus())
     return cfg, service
 
+
+@lru_cache(maxsize=1)
+def get_service() -> tuple[AppConfig, AsyncWalkingPadService]:
+    """Return the process-wide service, creating it (and its miio client) on first use."""
+    return create_service()
+
+
+async def reset_service() -> None:
+    """Close the process-wide service, if any, so the next `get_service()` builds a new one."""
+    if not get_service.cache_info().currsize:
+        return
+    _, service = get_service()
+    get_service.cache_clear()
+    await service.aclose()
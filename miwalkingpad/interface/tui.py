@@ -3,26 +3,60 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from datetime import timedelta
+from typing import Any
 
 from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal
 from textual.reactive import reactive
+from textual.validation import Number
 from textual.widgets import Button, Footer, Header, Input, Log, Select, Static
 
 from miwalkingpad.service import AsyncWalkingPadService
 from miwalkingpad.interface.config import AppConfig
+from miwalkingpad.types.events import (
+    CommandExecutedEvent,
+    DroppedEventsEvent,
+    ErrorEvent,
+    OperationTimingEvent,
+    StatusUpdatedEvent,
+)
 from miwalkingpad.types.models import PadMode, PadStatus
 
+_EVENT_NAMES: dict[type, str] = {
+    cls: cls.__name__
+    for cls in (
+        StatusUpdatedEvent,
+        CommandExecutedEvent,
+        ErrorEvent,
+        OperationTimingEvent,
+        DroppedEventsEvent,
+    )
+}
+
+
+# Consecutive polls usually report the same walking time; reuse the last rendering.
+_last_fmt_time: tuple[int, str] = (-1, "-")
+
 
 def _fmt_time(value: timedelta | None) -> str:
+    global _last_fmt_time
     if value is None:
         return "-"
-    secs = int(value.total_seconds())
-    h = secs // 3600
-    m = (secs % 3600) // 60
-    s = secs % 60
-    return f"{h:02d}:{m:02d}:{s:02d}"
+    secs = value.days * 86400 + value.seconds
+    if secs == _last_fmt_time[0]:
+        return _last_fmt_time[1]
+    h, rem = divmod(secs, 3600)
+    m, s = divmod(rem, 60)
+    text = f"{h:02d}:{m:02d}:{s:02d}"
+    _last_fmt_time = (secs, text)
+    return text
+
+
+def _parse_input(event: Input.Changed) -> float | None:
+    if event.validation_result is None or not event.validation_result.is_valid:
+        return None
+    return float(event.value)
 
 
 def _to_kcal(value: int | None) -> str:
@@ -31,33 +65,53 @@ def _to_kcal(value: int | None) -> str:
     return f"{value / 1000:.2f}"
 
 
+class _CommandRow(Horizontal):
+    DEFAULT_CLASSES = "row"
+
+    def compose(self) -> ComposeResult:
+        yield Button("Refresh", id="btn-refresh", variant="primary")
+        yield Button("Start", id="btn-start", variant="success")
+        yield Button("Stop", id="btn-stop", variant="warning")
+        yield Button("Power On", id="btn-on")
+        yield Button("Power Off", id="btn-off")
+
+
+class _SpeedRow(Horizontal):
+    DEFAULT_CLASSES = "row"
+
+    def compose(self) -> ComposeResult:
+        yield Button("Speed -0.5", id="btn-speed-down")
+        yield Button("Speed +0.5", id="btn-speed-up")
+        yield Input(
+            placeholder="Speed 0..6",
+            type="number",
+            validators=[Number(minimum=0, maximum=6)],
+            id="speed-input",
+        )
+        yield Button("Set Speed", id="btn-set-speed")
+        yield Input(
+            placeholder="Start speed 0..6",
+            type="number",
+            validators=[Number(minimum=0, maximum=6)],
+            id="start-speed-input",
+        )
+        yield Button("Set Start", id="btn-set-start-speed")
+
+
+class _ModeRow(Horizontal):
+    DEFAULT_CLASSES = "row"
+
+    def compose(self) -> ComposeResult:
+        yield Select(
+            options=[("auto", "auto"), ("manual", "manual"), ("off", "off")],
+            value="manual",
+            id="mode-select",
+        )
+        yield Button("Set Mode", id="btn-set-mode")
+
+
 class WalkingPadTuiApp(App[None]):
-    CSS = """
-    #root {
-        layout: vertical;
-        padding: 1;
-    }
-    #status {
-        height: 9;
-        border: round $accent;
-        padding: 1;
-    }
-    #actions {
-        height: 12;
-        border: round $secondary;
-        padding: 1;
-    }
-    #log {
-        height: 1fr;
-        border: round $primary;
-    }
-    .row {
-        height: auto;
-    }
-    Button {
-        margin-right: 1;
-    }
-    """
+    CSS_PATH = "tui.tcss"
 
     BINDINGS = [
         ("q", "quit", "Quit"),
@@ -70,8 +124,22 @@ class WalkingPadTuiApp(App[None]):
         ("-", "speed_down", "Speed -0.5"),
     ]
 
+    # Two fixed-width columns; the left column is padded to 20 characters.
+    _STATUS_TEMPLATE = (
+        "Power: {power!s:<13}Steps: {steps}\n"
+        "On: {is_on!s:<16}Distance: {distance} m\n"
+        "Mode: {mode!s:<14}Kcal: {kcal}\n"
+        "Speed: {speed!s:<13}Walking time: {walking_time}\n"
+        "Start speed: {start_speed!s}"
+    )
+
     status_text: reactive[str] = reactive("No data yet")
 
+    # Widgets resolved once in on_mount instead of per event/handler.
+    _log_widget: Log
+    _status_widget: Static
+    _mode_select: Select[str]
+
     def __init__(
         self,
         service_factory: Callable[[], tuple[AppConfig, AsyncWalkingPadService]],
@@ -81,6 +149,17 @@ class WalkingPadTuiApp(App[None]):
         self._config: AppConfig | None = None
         self._service: AsyncWalkingPadService | None = None
         self._event_task: asyncio.Task[None] | None = None
+        self._startup_task: asyncio.Task[None] | None = None
+        self._last_rendered = ""
+        # UI writes are buffered and flushed on a short interval to cap refreshes.
+        self._log_buffer: list[str] = []
+        self._pending_status_text = ""
+        self._status_dirty = False
+        # Target speed of +/- presses not yet sent; a burst is committed as one command.
+        self._pending_speed: float | None = None
+        # Speed inputs are parsed as they change; None while empty or out of range.
+        self._parsed_speed: float | None = None
+        self._parsed_start_speed: float | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -88,119 +167,161 @@ class WalkingPadTuiApp(App[None]):
             yield Static("Status", classes="title")
             yield Static(self.status_text, id="status")
             with Container(id="actions"):
-                with Horizontal(classes="row"):
-                    yield Button("Refresh", id="btn-refresh", variant="primary")
-                    yield Button("Start", id="btn-start", variant="success")
-                    yield Button("Stop", id="btn-stop", variant="warning")
-                    yield Button("Power On", id="btn-on")
-                    yield Button("Power Off", id="btn-off")
-                with Horizontal(classes="row"):
-                    yield Button("Speed -0.5", id="btn-speed-down")
-                    yield Button("Speed +0.5", id="btn-speed-up")
-                    yield Input(placeholder="Speed 0..6", id="speed-input")
-                    yield Button("Set Speed", id="btn-set-speed")
-                    yield Input(placeholder="Start speed 0..6", id="start-speed-input")
-                    yield Button("Set Start", id="btn-set-start-speed")
-                with Horizontal(classes="row"):
-                    yield Select(
-                        options=[("auto", "auto"), ("manual", "manual"), ("off", "off")],
-                        value="manual",
-                        id="mode-select",
-                    )
-                    yield Button("Set Mode", id="btn-set-mode")
+                yield _CommandRow()
+                yield _SpeedRow()
+                yield _ModeRow()
             yield Log(id="log", highlight=True)
         yield Footer()
 
     async def on_mount(self) -> None:
+        self._log_widget = self.query_one("#log", Log)
+        self._status_widget = self.query_one("#status", Static)
+        self._mode_select = self.query_one("#mode-select", Select)
         self._config, self._service = self._service_factory()
-        await self._service.start_polling(self._config.polling_interval_seconds)
         self._event_task = asyncio.create_task(self._consume_events())
-        asyncio.create_task(self._refresh_status())
-        self.query_one("#log", Log).write_line("Started polling")
+        # The handshake retries discovery for up to ~20 s on an unreachable pad; keep
+        # it off the mount path so the UI (and `q`) respond immediately.
+        self._startup_task = asyncio.create_task(self._startup(self._config, self._service))
+        self.set_interval(0.05, self._flush_log)
+        self.set_interval(1 / 30, self._flush_status)
+
+    async def _startup(self, config: AppConfig, service: AsyncWalkingPadService) -> None:
+        try:
+            await service.warmup()
+        except Exception as exc:  # noqa: BLE001
+            self._log_buffer.append(f"warmup: ERROR {exc}")
+        await service.start_polling(
+            config.polling_interval_seconds,
+            min_interval_seconds=config.polling_interval_min_seconds,
+            max_interval_seconds=config.polling_interval_max_seconds,
+        )
+        self._log_buffer.append("Started polling")
+        await self._refresh_status()
 
     async def on_unmount(self) -> None:
-        if self._service is not None:
-            await self._service.stop_polling()
-        if self._event_task is not None:
-            self._event_task.cancel()
+        for task in (self._startup_task, self._event_task):
+            if task is None:
+                continue
+            task.cancel()
             try:
-                await self._event_task
+                await task
             except asyncio.CancelledError:
                 pass
+        # The service is shared with the rest of the process; only stop our poller.
+        if self._service is not None:
+            await self._service.stop_polling()
 
     def _render_status(self, status: PadStatus) -> str:
-        left = [
-            f"Power: {status.power}",
-            f"On: {status.is_on}",
-            f"Mode: {status.mode.value if status.mode else '-'}",
-            f"Speed: {status.speed_kmh}",
-            f"Start speed: {status.start_speed_kmh}",
-        ]
-        right = [
-            f"Steps: {status.step_count}",
-            f"Distance: {status.distance_m} m",
-            f"Kcal: {_to_kcal(status.calories)}",
-            f"Walking time: {_fmt_time(status.walking_time)}",
-            f"",
-        ]
-        width = max(len(x) for x in left) + 4
-        return "\n".join(f"{l:<{width}}{r}" for l, r in zip(left, right, strict=False))
+        return self._STATUS_TEMPLATE.format(
+            power=status.power,
+            is_on=status.is_on,
+            mode=status.mode.value if status.mode else "-",
+            speed=status.speed_kmh,
+            start_speed=status.start_speed_kmh,
+            steps=status.step_count,
+            distance=status.distance_m,
+            kcal=_to_kcal(status.calories),
+            walking_time=_fmt_time(status.walking_time),
+        )
 
     async def _refresh_status(self) -> None:
         if not self._service:
             return
-        log = self.query_one("#log", Log)
         try:
             status = await self._service.get_status(quick=False)
-            self.status_text = self._render_status(status)
-            self.query_one("#status", Static).update(self.status_text)
+            self._show_status(status)
         except Exception as exc:  # noqa: BLE001
-            log.write_line(f"refresh: ERROR {exc}")
+            self._log_buffer.append(f"refresh: ERROR {exc}")
 
     async def _consume_events(self) -> None:
         if not self._service:
             return
-        log = self.query_one("#log", Log)
+        handlers: dict[str, Callable[[Any], str | None]] = {
+            OperationTimingEvent.kind: self._on_timing_event,
+            StatusUpdatedEvent.kind: self._on_status_event,
+            ErrorEvent.kind: self._on_error_event,
+            DroppedEventsEvent.kind: self._on_dropped_event,
+        }
         async for event in self._service.event_stream():
-            name = type(event).__name__
-            log.write_line(f"event: {name}")
-            if hasattr(event, "wait_ms") and hasattr(event, "run_ms") and hasattr(event, "total_ms"):
-                log.write_line(
-                    "timing "
-                    f"op={getattr(event, 'operation', '?')} "
-                    f"wait={getattr(event, 'wait_ms', 0.0):.1f}ms "
-                    f"run={getattr(event, 'run_ms', 0.0):.1f}ms "
-                    f"total={getattr(event, 'total_ms', 0.0):.1f}ms "
-                    f"ok={getattr(event, 'success', False)}"
-                )
-            if hasattr(event, "status"):
-                status = getattr(event, "status")
-                if isinstance(status, PadStatus):
-                    self.status_text = self._render_status(status)
-                    self.query_one("#status", Static).update(self.status_text)
-            if hasattr(event, "message") and hasattr(event, "operation"):
-                log.write_line(f"error in {event.operation}: {event.message}")
+            self._log_buffer.append(f"event: {_EVENT_NAMES.get(type(event), 'Event')}")
+            handler = handlers.get(event.kind)
+            if handler is not None and (line := handler(event)) is not None:
+                self._log_buffer.append(line)
+
+    def _on_timing_event(self, event: OperationTimingEvent) -> str | None:
+        return (
+            "timing "
+            f"op={event.operation} "
+            f"wait={event.wait_ms:.1f}ms "
+            f"run={event.run_ms:.1f}ms "
+            f"total={event.total_ms:.1f}ms "
+            f"ok={event.success}"
+        )
+
+    def _on_status_event(self, event: StatusUpdatedEvent) -> str | None:
+        self._show_status(event.status)
+        return None
+
+    def _on_error_event(self, event: ErrorEvent) -> str | None:
+        return f"error in {event.operation}: {event.message}"
+
+    def _on_dropped_event(self, event: DroppedEventsEvent) -> str | None:
+        return f"dropped {event.count} events (event log fell behind)"
+
+    def _show_status(self, status: PadStatus) -> None:
+        self.status_text = self._render_status(status)
+        self._set_status_text(self.status_text)
+
+    def _set_status_text(self, text: str) -> None:
+        # Unchanged polls (common when idle) must not invalidate the widget.
+        if text != self._last_rendered:
+            self._last_rendered = text
+            self._pending_status_text = text
+            self._status_dirty = True
+
+    def _flush_log(self) -> None:
+        if self._log_buffer:
+            self._log_widget.write_lines(self._log_buffer)
+            self._log_buffer.clear()
+
+    def _flush_status(self) -> None:
+        if self._status_dirty:
+            self._status_dirty = False
+            self._status_widget.update(self._pending_status_text)
 
     async def _run_action(self, label: str, coro) -> None:
-        log = self.query_one("#log", Log)
-        self.query_one("#status", Static).update(f"Executing: {label} ...")
+        self._set_status_text(f"Executing: {label} ...")
         try:
             result = await coro
-            log.write_line(f"{label}: {result.message}")
+            self._log_buffer.append(f"{label}: {result.message}")
             # Let polling update status naturally; avoid extra immediate full read.
         except Exception as exc:  # noqa: BLE001
-            log.write_line(f"{label}: ERROR {exc}")
+            self._log_buffer.append(f"{label}: ERROR {exc}")
 
     async def _adjust_speed(self, delta: float) -> None:
         if not self._service:
             return
-        status = self._service.latest_status
-        if status is None or status.speed_kmh is None:
-            status = await self._service.get_status(quick=False)
+        base = self._pending_speed
+        if base is None:
+            status = self._service.latest_status
+            if status is None or status.speed_kmh is None:
+                status = await self._service.get_status(quick=False)
+            base = status.speed_kmh or 0.0
+
+        self._pending_speed = max(0.0, min(6.0, round(base + delta, 1)))
+        # Awaiting the debounce here would stall the message pump for the whole window.
+        # Each press replaces the previous worker; the service's shielded commit is
+        # shared, so only the last worker of a burst reports its result.
+        self.run_worker(
+            self._commit_speed(self._pending_speed), group="set-speed", exclusive=True
+        )
 
-        base = status.speed_kmh or 0.0
-        new_speed = max(0.0, min(6.0, round(base + delta, 1)))
-        await self._run_action("set_speed", self._service.set_speed(new_speed))
+    async def _commit_speed(self, speed_kmh: float) -> None:
+        if not self._service:
+            return
+        await self._run_action("set_speed", self._service.set_speed_debounced(speed_kmh))
+        # Not reached when a newer press cancelled this worker; keep its target then.
+        self._pending_speed = None
 
     @on(Button.Pressed, "#btn-refresh")
     async def _btn_refresh(self) -> None:
@@ -224,8 +345,14 @@ class WalkingPadTuiApp(App[None]):
 
     @on(Button.Pressed, "#btn-set-speed")
     async def _btn_set_speed(self) -> None:
-        value = self.query_one("#speed-input", Input).value.strip()
-        await self._run_action("set_speed", self._service.set_speed(float(value)))
+        if self._parsed_speed is None:
+            self._set_status_text("Speed must be a number between 0 and 6")
+            return
+        await self._run_action("set_speed", self._service.set_speed(self._parsed_speed))
+
+    @on(Input.Changed, "#speed-input")
+    def _speed_input_changed(self, event: Input.Changed) -> None:
+        self._parsed_speed = _parse_input(event)
 
     @on(Input.Submitted, "#speed-input")
     async def _submit_speed_input(self) -> None:
@@ -241,19 +368,25 @@ class WalkingPadTuiApp(App[None]):
 
     @on(Button.Pressed, "#btn-set-start-speed")
     async def _btn_set_start_speed(self) -> None:
-        value = self.query_one("#start-speed-input", Input).value.strip()
+        if self._parsed_start_speed is None:
+            self._set_status_text("Start speed must be a number between 0 and 6")
+            return
         await self._run_action(
             "set_start_speed",
-            self._service.set_start_speed(float(value)),
+            self._service.set_start_speed(self._parsed_start_speed),
         )
 
+    @on(Input.Changed, "#start-speed-input")
+    def _start_speed_input_changed(self, event: Input.Changed) -> None:
+        self._parsed_start_speed = _parse_input(event)
+
     @on(Input.Submitted, "#start-speed-input")
     async def _submit_start_speed_input(self) -> None:
         await self._btn_set_start_speed()
 
     @on(Button.Pressed, "#btn-set-mode")
     async def _btn_set_mode(self) -> None:
-        value = str(self.query_one("#mode-select", Select).value)
+        value = str(self._mode_select.value)
         await self._run_action("set_mode", self._service.set_mode(PadMode(value)))
 
     async def action_refresh(self) -> None:
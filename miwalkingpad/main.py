@@ -1,10 +1,12 @@
-from miwalkingpad.interface.cli import app
+from miwalkingpad.interface.cli import app, close_runner
 
 
 def run() -> None:
-    app()
+    try:
+        app()
+    finally:
+        close_runner()
 
 
 if __name__ == "__main__":
     run()
-
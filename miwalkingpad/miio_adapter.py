@@ -1,20 +1,55 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from datetime import timedelta
+from time import monotonic
+from typing import Any
 
-from miio import DeviceException
+from miio import DeviceError, DeviceException
+from miio.exceptions import RecoverableError
 from miio.walkingpad import (
     OperationMode,
     OperationSensitivity,
     Walkingpad,
     WalkingpadException,
-    WalkingpadStatus,
 )
 
 from miwalkingpad.types.errors import CommandValidationError, DeviceCommunicationError
 from miwalkingpad.types.models import CommandResult, PadMode, PadSensitivity, PadStatus
 
+_MODE_TO_PAD = {
+    OperationMode.Auto: PadMode.AUTO,
+    OperationMode.Manual: PadMode.MANUAL,
+    OperationMode.Off: PadMode.OFF,
+}
+_PAD_TO_MODE = {v: k for k, v in _MODE_TO_PAD.items()}
+
+_SENSITIVITY_TO_PAD = {
+    OperationSensitivity.High: PadSensitivity.HIGH,
+    OperationSensitivity.Medium: PadSensitivity.MEDIUM,
+    OperationSensitivity.Low: PadSensitivity.LOW,
+}
+_PAD_TO_SENSITIVITY = {v: k for k, v in _SENSITIVITY_TO_PAD.items()}
+
+_VALID_MODE_VALUES = frozenset(m.value for m in OperationMode)
+_VALID_SENSITIVITY_VALUES = frozenset(s.value for s in OperationSensitivity)
+
+# (raw payload key, cast, PadStatus field) for plain numeric status fields.
+_NUMERIC_FIELDS = (
+    ("sp", float, "speed_kmh"),
+    ("start_speed", float, "start_speed_kmh"),
+    ("step", int, "step_count"),
+    ("dist", int, "distance_m"),
+    ("cal", int, "calories"),
+)
+_MISSING = object()
+
+# Payload of get_prop ["all"], e.g. ['mode:1', 'time:1387', 'sp:3.0', 'dist:1150', ...].
+_QUICK_STATUS_CASTS = {"sp": float, "step": int, "cal": int, "time": int, "dist": int, "mode": int}
+# Properties missing from the quick payload; python-miio reads them one request each.
+_EXTRA_STATUS_PROPS = ("power", "mode", "start_speed", "sensitivity")
+
 
 @dataclass(slots=True)
 class WalkingPadAdapter:
@@ -25,6 +60,11 @@ class WalkingPadAdapter:
     model: str
     timeout_seconds: float = 5.0
     _device: Walkingpad = field(init=False, repr=False)
+    _batched_props: bool | None = field(init=False, default=None, repr=False)
+    # (monotonic time, quick, status) of the last read; cleared by every command.
+    _last_status: tuple[float, bool, PadStatus] | None = field(
+        init=False, default=None, repr=False
+    )
 
     def __post_init__(self) -> None:
         timeout = max(1, int(round(self.timeout_seconds)))
@@ -39,29 +79,82 @@ class WalkingPadAdapter:
     def supported_models(self) -> tuple[str, ...]:
         return tuple(self._device.supported_models)
 
-    def status(self, *, quick: bool = False) -> PadStatus:
+    def warmup(self) -> None:
+        """Establish the miIO session (handshake) ahead of the first real command."""
         try:
-            raw = self._device.quick_status() if quick else self._device.status()
-            return self._map_status(raw)
-        except KeyError:
-            # Some models/firmwares do not return the full property set expected by
-            # python-miio status(); fall back to quick status payload.
-            try:
-                raw = self._device.quick_status()
-                return self._map_status(raw)
-            except Exception as exc:  # noqa: BLE001
-                raise DeviceCommunicationError(str(exc)) from exc
+            self._device.send_handshake()
+        except DeviceException as exc:
+            raise DeviceCommunicationError(str(exc)) from exc
+
+    def status(self, *, quick: bool = False, max_age: float = 0.2) -> PadStatus:
+        """Read status, reusing a read younger than `max_age` seconds.
+
+        A cached full read also satisfies a quick request. Pass `max_age=0` to force a
+        device round-trip.
+        """
+        now = monotonic()
+        last = self._last_status
+        if last is not None and now - last[0] < max_age and (quick or not last[1]):
+            return last[2]
+
+        # Use raw get_prop instead of python-miio status()/quick_status(): the full
+        # status there costs one round-trip per extra property, and its quick parser
+        # raises KeyError on properties it does not know.
+        try:
+            data = self._read_quick_status()
+            if not quick:
+                data.update(self._read_extra_status())
         except (DeviceException, WalkingpadException) as exc:
             raise DeviceCommunicationError(str(exc)) from exc
+        except (TypeError, ValueError) as exc:
+            raise DeviceCommunicationError(f"Malformed status payload: {exc}") from exc
+        status = self._map_status(data)
+        self._last_status = (now, quick, status)
+        return status
+
+    def _read_quick_status(self) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for item in self._device.send("get_prop", ["all"]):
+            key, _, value = str(item).partition(":")
+            cast = _QUICK_STATUS_CASTS.get(key)
+            if cast is not None:
+                data[key] = cast(value)
+        return data
+
+    def _read_extra_status(self) -> dict[str, Any]:
+        props = list(_EXTRA_STATUS_PROPS)
+        if self._batched_props is not False:
+            # Probe once whether the firmware answers a multi-property get_prop and
+            # remember the outcome; fall back to one request per property otherwise.
+            # Only an error reply counts as "cannot batch": timeouts and recoverable
+            # errors propagate and leave the probe undecided.
+            try:
+                values = self._device.send("get_prop", props)
+            except DeviceError as exc:
+                if self._batched_props or isinstance(exc, RecoverableError):
+                    raise
+                values = []
+            if len(values) == len(props):
+                self._batched_props = True
+                return dict(zip(props, values))
+            self._batched_props = False
+
+        data: dict[str, Any] = {}
+        for prop in props:
+            values = self._device.send("get_prop", [prop])
+            if values:
+                data[prop] = values[0]
+        return data
 
     def start(self) -> CommandResult:
         # Avoid python-miio start() pre-status check (extra IO round-trip).
         # Try run directly first, then fallback to power-on + run.
+        self._last_status = None
         try:
             self._device.send("set_state", ["run"])
         except (WalkingpadException, DeviceException):
             self._run_command("power_on", self._device.on)
-            self._run_command("start", lambda: self._device.send("set_state", ["run"]))
+            self._run_command("start", self._device.send, "set_state", ["run"])
         return CommandResult(command="start", success=True, message="ok")
 
     def stop(self) -> CommandResult:
@@ -83,38 +176,29 @@ class WalkingPadAdapter:
         if speed_kmh < 0 or speed_kmh > 6:
             raise CommandValidationError("speed_kmh must be between 0 and 6")
         # Use raw send to avoid python-miio set_speed() pre-status check.
-        return self._run_command(
-            "set_speed",
-            lambda: self._device.send("set_speed", [float(speed_kmh)]),
-        )
+        return self._run_command("set_speed", self._device.send, "set_speed", [float(speed_kmh)])
 
     def set_start_speed(self, speed_kmh: float) -> CommandResult:
         if speed_kmh < 0 or speed_kmh > 6:
             raise CommandValidationError("start_speed_kmh must be between 0 and 6")
         return self._run_command(
-            "set_start_speed",
-            lambda: self._device.send("set_start_speed", [float(speed_kmh)]),
+            "set_start_speed", self._device.send, "set_start_speed", [float(speed_kmh)]
         )
 
     def set_mode(self, mode: PadMode) -> CommandResult:
-        mapped = {
-            PadMode.AUTO: OperationMode.Auto,
-            PadMode.MANUAL: OperationMode.Manual,
-            PadMode.OFF: OperationMode.Off,
-        }[mode]
-        return self._run_command("set_mode", lambda: self._device.set_mode(mapped))
+        mapped = _PAD_TO_MODE[mode]
+        return self._run_command("set_mode", self._device.set_mode, mapped)
 
     def set_sensitivity(self, sensitivity: PadSensitivity) -> CommandResult:
-        mapped = {
-            PadSensitivity.HIGH: OperationSensitivity.High,
-            PadSensitivity.MEDIUM: OperationSensitivity.Medium,
-            PadSensitivity.LOW: OperationSensitivity.Low,
-        }[sensitivity]
-        return self._run_command("set_sensitivity", lambda: self._device.set_sensitivity(mapped))
-
-    def _run_command(self, command: str, func) -> CommandResult:
+        mapped = _PAD_TO_SENSITIVITY[sensitivity]
+        return self._run_command("set_sensitivity", self._device.set_sensitivity, mapped)
+
+    def _run_command(
+        self, command: str, func: Callable[..., object], *args: object
+    ) -> CommandResult:
+        self._last_status = None
         try:
-            func()
+            func(*args)
         except WalkingpadException as exc:
             raise CommandValidationError(str(exc)) from exc
         except DeviceException as exc:
@@ -122,58 +206,34 @@ class WalkingPadAdapter:
         return CommandResult(command=command, success=True, message="ok")
 
     @staticmethod
-    def _map_status(raw: WalkingpadStatus) -> PadStatus:
-        mode_map = {
-            OperationMode.Auto: PadMode.AUTO,
-            OperationMode.Manual: PadMode.MANUAL,
-            OperationMode.Off: PadMode.OFF,
-        }
-        sensitivity_map = {
-            OperationSensitivity.High: PadSensitivity.HIGH,
-            OperationSensitivity.Medium: PadSensitivity.MEDIUM,
-            OperationSensitivity.Low: PadSensitivity.LOW,
-        }
-
+    def _map_status(data: Mapping[str, Any]) -> PadStatus:
         mode = None
         sensitivity = None
 
-        data = getattr(raw, "data", {}) or {}
-
-        raw_mode = None
-        if "mode" in data:
-            try:
-                raw_mode = OperationMode(data["mode"])
-            except Exception:
-                raw_mode = None
-        mode = mode_map.get(raw_mode) if raw_mode is not None else None
+        if (raw_mode := data.get("mode")) in _VALID_MODE_VALUES:
+            mode = _MODE_TO_PAD[OperationMode(raw_mode)]
 
-        raw_sensitivity = None
-        if "sensitivity" in data:
-            try:
-                raw_sensitivity = OperationSensitivity(data["sensitivity"])
-            except Exception:
-                raw_sensitivity = None
-        sensitivity = sensitivity_map.get(raw_sensitivity) if raw_sensitivity is not None else None
+        if (raw_sensitivity := data.get("sensitivity")) in _VALID_SENSITIVITY_VALUES:
+            sensitivity = _SENSITIVITY_TO_PAD[OperationSensitivity(raw_sensitivity)]
 
         walking_time = None
-        if "time" in data:
+        if (raw_time := data.get("time")) is not None:
             try:
-                walking_time = timedelta(seconds=int(data["time"]))
-            except Exception:
+                walking_time = timedelta(seconds=int(raw_time))
+            except (TypeError, ValueError):
                 walking_time = None
 
-        if walking_time is not None and not isinstance(walking_time, timedelta):
-            walking_time = timedelta(seconds=int(walking_time))
+        numeric: dict[str, Any] = {}
+        for key, cast, name in _NUMERIC_FIELDS:
+            value = data.get(key, _MISSING)
+            numeric[name] = cast(value) if value is not _MISSING else None
 
+        power = data.get("power")
         return PadStatus(
-            is_on=(data.get("power") == "on") if "power" in data else None,
-            power=data.get("power"),
+            is_on=(power == "on") if power is not None else None,
+            power=power,
             mode=mode,
-            speed_kmh=float(data["sp"]) if "sp" in data else None,
-            start_speed_kmh=float(data["start_speed"]) if "start_speed" in data else None,
             sensitivity=sensitivity,
-            step_count=int(data["step"]) if "step" in data else None,
-            distance_m=int(data["dist"]) if "dist" in data else None,
-            calories=int(data["cal"]) if "cal" in data else None,
             walking_time=walking_time,
+            **numeric,
         )
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import deque
+from time import monotonic
+
+from miwalkingpad.types.models import PadStatus
+
+DEFAULT_MAX_INTERVAL = 5.0
+
+
+def _state_key(status: PadStatus) -> tuple[object, ...]:
+    # The step counter is included so an active walk keeps polling densely; it only
+    # stays constant while the pad is idle.
+    return (
+        status.power,
+        status.mode,
+        status.speed_kmh,
+        status.start_speed_kmh,
+        status.sensitivity,
+        status.step_count,
+    )
+
+
+class PollScheduler:
+    """Chooses the delay before the next status poll.
+
+    Polls at the minimum interval right after a command or an observed state change
+    and backs off exponentially while the pad state is stable. The back-off ceiling is
+    the configured maximum, lowered to the median gap between recently observed state
+    changes so polling stays dense enough to catch the next typical transition. Once
+    the state has been stable for longer than that ceiling, the gap history is
+    discarded so an idle pad backs off to the full maximum again.
+
+    `min_interval` defaults to `base_interval` and `max_interval` to 5 s (or the
+    minimum, if that is larger); explicit bounds are used as given.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        *,
+        min_interval: float | None = None,
+        max_interval: float | None = None,
+        backoff: float = 1.5,
+        history: int = 16,
+    ) -> None:
+        self.min_interval = min_interval or base_interval
+        self.max_interval = max_interval or max(DEFAULT_MAX_INTERVAL, self.min_interval)
+        if self.min_interval > self.max_interval:
+            raise ValueError(
+                f"min_interval ({self.min_interval}) must be <= max_interval ({self.max_interval})"
+            )
+        self._backoff = backoff
+        self._interval = self.min_interval
+        self._last_key: tuple[object, ...] | None = None
+        self._last_change: float | None = None
+        self._change_gaps: deque[float] = deque(maxlen=history)
+
+    def record_command(self) -> None:
+        """Return to dense polling after a user command."""
+        self._interval = self.min_interval
+
+    def next_interval(self, status: PadStatus | None) -> float:
+        """Return the sleep before the next poll, given the latest poll result."""
+        if status is not None:
+            key = _state_key(status)
+            if key != self._last_key:
+                now = monotonic()
+                if self._last_key is not None and self._last_change is not None:
+                    self._change_gaps.append(now - self._last_change)
+                self._last_key = key
+                self._last_change = now
+                self._interval = self.min_interval
+                return self._interval
+
+        if (
+            self._change_gaps
+            and self._last_change is not None
+            and monotonic() - self._last_change > self._ceiling()
+        ):
+            # The recent change rate (e.g. steps during a walk) no longer applies.
+            self._change_gaps.clear()
+
+        interval = self._interval
+        self._interval = min(self._interval * self._backoff, self._ceiling())
+        return interval
+
+    def _ceiling(self) -> float:
+        if not self._change_gaps:
+            return self.max_interval
+        gaps = sorted(self._change_gaps)
+        median = gaps[len(gaps) // 2]
+        return max(self.min_interval, min(self.max_interval, median))
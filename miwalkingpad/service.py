@@ -2,19 +2,30 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncIterator, Callable
-from datetime import datetime, UTC
-from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import replace
+from functools import partial
+from time import perf_counter, time
+from typing import cast
 
 from miwalkingpad.event_bus import AsyncEventBus
+from miwalkingpad.polling import PollScheduler
 from miwalkingpad.types.events import (
     CommandExecutedEvent,
     ErrorEvent,
     OperationTimingEvent,
     StatusUpdatedEvent,
+    WalkingPadEvent,
 )
 from miwalkingpad.types.models import CommandResult, PadMode, PadSensitivity, PadStatus
 from miwalkingpad.miio_adapter import WalkingPadAdapter
 
+# Polls read the quick status and do a full read every Nth poll and after commands.
+_FULL_STATUS_EVERY = 10
+# Settings only a full read returns; quick reads carry them over from the last one.
+_FULL_ONLY_FIELDS = ("is_on", "power", "start_speed_kmh", "sensitivity")
+
 
 class AsyncWalkingPadService:
     """Async-facing service wrapping synchronous miio operations."""
@@ -24,14 +35,53 @@ class AsyncWalkingPadService:
         self._event_bus = event_bus or AsyncEventBus()
         self._polling_task: asyncio.Task[None] | None = None
         self._latest_status: PadStatus | None = None
-        self._io_lock = asyncio.Lock()
+        # python-miio is blocking and assumes one session; keep all device I/O on a
+        # single dedicated thread instead of the shared default executor. The single
+        # worker also serializes operations, so no separate I/O lock is needed.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="miio")
+        # Device operations issued but not finished (queued or running).
+        self._active_ops = 0
+        self._poll_scheduler: PollScheduler | None = None
+        # Set by commands to cut the poller's back-off sleep short.
+        self._poll_wake = asyncio.Event()
+        self._quick_polls_left = 0
+        self._inflight_status: asyncio.Task[PadStatus] | None = None
+        self._inflight_status_quick = False
+        self._pending_speed = 0.0
+        self._speed_deadline = 0.0
+        self._speed_commit: asyncio.Task[CommandResult] | None = None
+
+    async def warmup(self) -> None:
+        """Handshake with the device so the first command does not pay for it."""
+        await self._run_blocking(self._adapter.warmup, "warmup")
 
     async def get_status(self, *, quick: bool = False) -> PadStatus:
-        status = await self._run_blocking(lambda: self._adapter.status(quick=quick), "get_status")
+        # Join a read already in flight (poller, refresh, ...) instead of issuing a
+        # second device round-trip; a full read also satisfies a quick request.
+        inflight = self._inflight_status
+        if inflight is None or inflight.done() or (self._inflight_status_quick and not quick):
+            inflight = asyncio.create_task(self._read_status(quick))
+            self._inflight_status = inflight
+            self._inflight_status_quick = quick
+        return await asyncio.shield(inflight)
+
+    async def _read_status(self, quick: bool) -> PadStatus:
+        status = await self._run_blocking(partial(self._adapter.status, quick=quick), "get_status")
+        previous = self._latest_status
+        if quick and previous is not None:
+            status = replace(
+                status,
+                **{
+                    name: getattr(previous, name)
+                    for name in _FULL_ONLY_FIELDS
+                    if getattr(status, name) is None
+                },
+            )
         self._latest_status = status
-        await self._event_bus.publish(
-            StatusUpdatedEvent(timestamp=datetime.now(UTC), status=status, quick=quick)
-        )
+        if self._event_bus.has_subscribers():
+            await self._event_bus.publish(
+                StatusUpdatedEvent(timestamp=time(), status=status, quick=quick)
+            )
         return status
 
     async def start(self) -> CommandResult:
@@ -53,47 +103,105 @@ class AsyncWalkingPadService:
         return await self._run_command(self._adapter.unlock, "unlock")
 
     async def set_speed(self, speed_kmh: float) -> CommandResult:
-        return await self._run_command(lambda: self._adapter.set_speed(speed_kmh), "set_speed")
+        return await self._run_command(partial(self._adapter.set_speed, speed_kmh), "set_speed")
+
+    async def set_speed_debounced(
+        self, speed_kmh: float, *, delay_seconds: float = 0.12
+    ) -> CommandResult:
+        """Set speed after a short idle window, collapsing rapid calls into one command.
+
+        Every caller within the window receives the result of the single command that
+        sends the most recent value.
+        """
+        loop = asyncio.get_running_loop()
+        self._pending_speed = speed_kmh
+        self._speed_deadline = loop.time() + delay_seconds
+        commit = self._speed_commit
+        if commit is None or commit.done():
+            commit = asyncio.create_task(self._commit_pending_speed())
+            self._speed_commit = commit
+        return await asyncio.shield(commit)
+
+    async def _commit_pending_speed(self) -> CommandResult:
+        loop = asyncio.get_running_loop()
+        while (remaining := self._speed_deadline - loop.time()) > 0:
+            await asyncio.sleep(remaining)
+        # Calls arriving from now on start a new debounce window.
+        self._speed_commit = None
+        return await self.set_speed(self._pending_speed)
 
     async def set_start_speed(self, speed_kmh: float) -> CommandResult:
         return await self._run_command(
-            lambda: self._adapter.set_start_speed(speed_kmh), "set_start_speed"
+            partial(self._adapter.set_start_speed, speed_kmh), "set_start_speed"
         )
 
     async def set_mode(self, mode: PadMode) -> CommandResult:
-        return await self._run_command(lambda: self._adapter.set_mode(mode), "set_mode")
+        return await self._run_command(partial(self._adapter.set_mode, mode), "set_mode")
 
     async def set_sensitivity(self, sensitivity: PadSensitivity) -> CommandResult:
         return await self._run_command(
-            lambda: self._adapter.set_sensitivity(sensitivity),
+            partial(self._adapter.set_sensitivity, sensitivity),
             "set_sensitivity",
         )
 
-    async def event_stream(self) -> AsyncIterator[object]:
+    async def event_stream(self) -> AsyncIterator[WalkingPadEvent]:
         async for event in self._event_bus.stream():
-            yield event
+            # The service is the only publisher on its bus, so the set is closed.
+            yield cast(WalkingPadEvent, event)
 
-    async def start_polling(self, interval_seconds: float = 1.0) -> None:
+    async def start_polling(
+        self,
+        interval_seconds: float = 1.0,
+        *,
+        min_interval_seconds: float | None = None,
+        max_interval_seconds: float | None = None,
+    ) -> None:
+        """Poll status in the background.
+
+        Polling runs at `min_interval_seconds` (default: `interval_seconds`) after
+        commands and state changes, and backs off towards `max_interval_seconds`
+        (default: 5 s) while the pad state is unchanged. Most polls are quick reads;
+        every tenth poll, and the first one after a command, is a full read.
+        """
         if self._polling_task and not self._polling_task.done():
             return
 
+        scheduler = PollScheduler(
+            interval_seconds,
+            min_interval=min_interval_seconds,
+            max_interval=max_interval_seconds,
+        )
+        self._poll_scheduler = scheduler
+
         async def _poll_loop() -> None:
             while True:
+                status: PadStatus | None = None
                 try:
                     # Do not queue polling behind interactive commands.
-                    if self._io_lock.locked():
-                        await asyncio.sleep(interval_seconds)
+                    if self._active_ops > 0:
+                        await asyncio.sleep(scheduler.min_interval)
                         continue
-                    await self.get_status(quick=False)
+                    quick = self._quick_polls_left > 0
+                    status = await self.get_status(quick=quick)
+                    if quick:
+                        self._quick_polls_left -= 1
+                    else:
+                        self._quick_polls_left = _FULL_STATUS_EVERY - 1
                 except Exception as exc:  # noqa: BLE001
-                    await self._event_bus.publish(
-                        ErrorEvent(
-                            timestamp=datetime.now(UTC),
-                            operation="poll",
-                            message=str(exc),
+                    if self._event_bus.has_subscribers():
+                        await self._event_bus.publish(
+                            ErrorEvent(
+                                timestamp=time(),
+                                operation="poll",
+                                message=str(exc),
+                            )
                         )
-                    )
-                await asyncio.sleep(interval_seconds)
+                # Back off linearly while subscribers have not drained earlier events.
+                backlog = min(self._event_bus.pressure(), 5)
+                delay = scheduler.next_interval(status) * (1 + backlog)
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._poll_wake.wait(), delay)
+                self._poll_wake.clear()
 
         self._polling_task = asyncio.create_task(_poll_loop(), name="walkingpad-poll")
 
@@ -107,52 +215,85 @@ class AsyncWalkingPadService:
             pass
         finally:
             self._polling_task = None
+            self._poll_scheduler = None
+
+    async def aclose(self) -> None:
+        """Stop polling and release the device I/O thread."""
+        await self.stop_polling()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     @property
     def latest_status(self) -> PadStatus | None:
         return self._latest_status
 
     async def _run_command(self, func: Callable[[], CommandResult], operation: str) -> CommandResult:
-        result = await self._run_blocking(func, operation)
-        await self._event_bus.publish(CommandExecutedEvent(timestamp=datetime.now(UTC), result=result))
+        try:
+            result = await self._run_blocking(func, operation)
+        finally:
+            # Commands may change settings that only a full read reports.
+            self._quick_polls_left = 0
+            if self._poll_scheduler is not None:
+                self._poll_scheduler.record_command()
+                self._poll_wake.set()
+        if self._event_bus.has_subscribers():
+            await self._event_bus.publish(
+                CommandExecutedEvent(timestamp=time(), result=result)
+            )
         return result
 
     async def _run_blocking(self, func: Callable[[], object], operation: str):
+        loop = asyncio.get_running_loop()
+        self._active_ops += 1
+        try:
+            if not self._event_bus.has_subscribers():
+                # Nobody consumes timing or error events (e.g. CLI): skip the clock reads.
+                return await loop.run_in_executor(self._executor, func)
+            return await self._run_timed(loop, func, operation)
+        finally:
+            self._active_ops -= 1
+
+    async def _run_timed(
+        self, loop: asyncio.AbstractEventLoop, func: Callable[[], object], operation: str
+    ):
         start = perf_counter()
-        wait_ms = 0.0
-        run_ms = 0.0
         try:
-            lock_wait_start = perf_counter()
-            async with self._io_lock:
-                wait_ms = (perf_counter() - lock_wait_start) * 1000.0
-                run_start = perf_counter()
-                result = await asyncio.to_thread(func)
-                run_ms = (perf_counter() - run_start) * 1000.0
-            total_ms = (perf_counter() - start) * 1000.0
-            await self._event_bus.publish(
-                OperationTimingEvent(
-                    timestamp=datetime.now(UTC),
-                    operation=operation,
-                    wait_ms=wait_ms,
-                    run_ms=run_ms,
-                    total_ms=total_ms,
-                    success=True,
-                )
+            run_start, result, run_end = await loop.run_in_executor(
+                self._executor, _timed_call, func
             )
-            return result
         except Exception as exc:  # noqa: BLE001
             total_ms = (perf_counter() - start) * 1000.0
             await self._event_bus.publish(
                 OperationTimingEvent(
-                    timestamp=datetime.now(UTC),
+                    timestamp=time(),
                     operation=operation,
-                    wait_ms=wait_ms,
-                    run_ms=run_ms,
+                    wait_ms=0.0,
+                    run_ms=0.0,
                     total_ms=total_ms,
                     success=False,
                 )
             )
             await self._event_bus.publish(
-                ErrorEvent(timestamp=datetime.now(UTC), operation=operation, message=str(exc))
+                ErrorEvent(timestamp=time(), operation=operation, message=str(exc))
             )
             raise
+        # Time spent queued behind other operations on the device thread.
+        wait_ms = (run_start - start) * 1000.0
+        run_ms = (run_end - run_start) * 1000.0
+        await self._event_bus.publish(
+            OperationTimingEvent(
+                timestamp=time(),
+                operation=operation,
+                wait_ms=wait_ms,
+                run_ms=run_ms,
+                total_ms=wait_ms + run_ms,
+                success=True,
+            )
+        )
+        return result
+
+
+def _timed_call(func: Callable[[], object]) -> tuple[float, object, float]:
+    """Run `func` on the device thread, returning (start, result, end) perf counters."""
+    started = perf_counter()
+    result = func()
+    return started, result, perf_counter()
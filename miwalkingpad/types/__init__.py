@@ -8,9 +8,11 @@ from miwalkingpad.types.errors import (
 )
 from miwalkingpad.types.events import (
     CommandExecutedEvent,
+    DroppedEventsEvent,
     ErrorEvent,
     OperationTimingEvent,
     StatusUpdatedEvent,
+    WalkingPadEvent,
 )
 from miwalkingpad.types.models import CommandResult, PadMode, PadSensitivity, PadStatus
 
@@ -23,6 +25,8 @@ __all__ = [
     "CommandExecutedEvent",
     "ErrorEvent",
     "OperationTimingEvent",
+    "DroppedEventsEvent",
+    "WalkingPadEvent",
     "WalkingPadAppError",
     "ConfigurationError",
     "DeviceCommunicationError",
@@ -1,36 +1,67 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from typing import ClassVar
 
 from miwalkingpad.types.models import CommandResult, PadStatus
 
+# Event timestamps are Unix epoch seconds (`time.time()`); convert with
+# `datetime.fromtimestamp(ts, UTC)` only where they are displayed.
+
 
 @dataclass(slots=True)
 class StatusUpdatedEvent:
-    timestamp: datetime
+    kind: ClassVar[str] = "status"
+
+    timestamp: float
     status: PadStatus
     quick: bool
 
 
 @dataclass(slots=True)
 class CommandExecutedEvent:
-    timestamp: datetime
+    kind: ClassVar[str] = "command"
+
+    timestamp: float
     result: CommandResult
 
 
 @dataclass(slots=True)
 class ErrorEvent:
-    timestamp: datetime
+    kind: ClassVar[str] = "error"
+
+    timestamp: float
     operation: str
     message: str
 
 
 @dataclass(slots=True)
 class OperationTimingEvent:
-    timestamp: datetime
+    kind: ClassVar[str] = "timing"
+
+    timestamp: float
     operation: str
     wait_ms: float
     run_ms: float
     total_ms: float
     success: bool
+
+
+@dataclass(slots=True)
+class DroppedEventsEvent:
+    """Emitted in place of `count` events discarded because the subscriber fell behind."""
+
+    kind: ClassVar[str] = "dropped"
+
+    timestamp: float
+    count: int
+
+
+WalkingPadEvent = (
+    StatusUpdatedEvent
+    | CommandExecutedEvent
+    | ErrorEvent
+    | OperationTimingEvent
+    | DroppedEventsEvent
+)
+"""Closed set of events published by `AsyncWalkingPadService`."""
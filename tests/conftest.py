@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from miwalkingpad.types.models import CommandResult, PadMode, PadSensitivity, PadStatus
+
+
+class FakeAdapter:
+    """In-memory stand-in for `WalkingPadAdapter` that records what the service asks for.
+
+    Set `read_delay` to make status reads block, and `partial_quick_status` to have
+    quick reads omit the settings (power, start speed, sensitivity) like the device.
+    """
+
+    model = "ksmb.walkingpad.v1"
+    supported_models = ("ksmb.walkingpad.v1",)
+
+    def __init__(self) -> None:
+        self.speed_kmh = 3.0
+        self.read_delay = 0.0
+        self.partial_quick_status = False
+        self.reads: list[bool] = []
+        self.read_times: list[float] = []
+        self.speeds: list[float] = []
+
+    def warmup(self) -> None:
+        return None
+
+    def status(self, *, quick: bool = False) -> PadStatus:
+        self.reads.append(quick)
+        self.read_times.append(time.monotonic())
+        if self.read_delay:
+            time.sleep(self.read_delay)
+        status = PadStatus(
+            is_on=True,
+            power="on",
+            mode=PadMode.MANUAL,
+            speed_kmh=self.speed_kmh,
+            start_speed_kmh=2.0,
+            sensitivity=PadSensitivity.MEDIUM,
+            step_count=10,
+            distance_m=12,
+            calories=3,
+            walking_time=timedelta(seconds=5),
+        )
+        if quick and self.partial_quick_status:
+            status.is_on = status.power = status.start_speed_kmh = status.sensitivity = None
+            status.step_count = 20
+        return status
+
+    def start(self) -> CommandResult:
+        return CommandResult(command="start", success=True, message="ok")
+
+    def stop(self) -> CommandResult:
+        return CommandResult(command="stop", success=True, message="ok")
+
+    def power_on(self) -> CommandResult:
+        return CommandResult(command="power_on", success=True, message="ok")
+
+    def power_off(self) -> CommandResult:
+        return CommandResult(command="power_off", success=True, message="ok")
+
+    def lock(self) -> CommandResult:
+        return CommandResult(command="lock", success=True, message="ok")
+
+    def unlock(self) -> CommandResult:
+        return CommandResult(command="unlock", success=True, message="ok")
+
+    def set_speed(self, speed_kmh: float) -> CommandResult:
+        self.speeds.append(speed_kmh)
+        return CommandResult(command="set_speed", success=True, message="ok")
+
+    def set_start_speed(self, _: float) -> CommandResult:
+        return CommandResult(command="set_start_speed", success=True, message="ok")
+
+    def set_mode(self, _: PadMode) -> CommandResult:
+        return CommandResult(command="set_mode", success=True, message="ok")
+
+    def set_sensitivity(self, _: PadSensitivity) -> CommandResult:
+        return CommandResult(command="set_sensitivity", success=True, message="ok")
+
+
+@pytest.fixture
+def fake_adapter() -> FakeAdapter:
+    return FakeAdapter()
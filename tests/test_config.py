@@ -54,3 +54,43 @@ def test_load_config_invalid_request_timeout(monkeypatch):
         assert False, "Expected ConfigurationError"
     except ConfigurationError as exc:
         assert "WALKINGPAD_REQUEST_TIMEOUT" in str(exc)
+
+
+def test_load_config_is_cached_until_env_changes(monkeypatch):
+    monkeypatch.setenv("WALKINGPAD_IP", "192.168.1.10")
+    monkeypatch.setenv("WALKINGPAD_TOKEN", "abc123")
+
+    first = load_config()
+    assert load_config() is first
+
+    monkeypatch.setenv("WALKINGPAD_IP", "192.168.1.11")
+    second = load_config()
+    assert second is not first
+    assert second.walkingpad_ip == "192.168.1.11"
+
+
+def test_load_config_polling_bounds(monkeypatch):
+    monkeypatch.setenv("WALKINGPAD_IP", "192.168.1.10")
+    monkeypatch.setenv("WALKINGPAD_TOKEN", "abc123")
+    monkeypatch.setenv("WALKINGPAD_POLLING_INTERVAL_MIN", "5")
+    monkeypatch.setenv("WALKINGPAD_POLLING_INTERVAL_MAX", "2")
+
+    try:
+        load_config()
+        assert False, "Expected ConfigurationError"
+    except ConfigurationError as exc:
+        assert "WALKINGPAD_POLLING_INTERVAL_MIN" in str(exc)
+
+    monkeypatch.setenv("WALKINGPAD_POLLING_INTERVAL_MIN", "0.5")
+    cfg = load_config()
+    assert cfg.polling_interval_min_seconds == 0.5
+    assert cfg.polling_interval_max_seconds == 2.0
+
+    # Without an explicit minimum, the polling interval must not exceed the maximum.
+    monkeypatch.delenv("WALKINGPAD_POLLING_INTERVAL_MIN")
+    monkeypatch.setenv("WALKINGPAD_POLLING_INTERVAL_MAX", "0.8")
+    try:
+        load_config()
+        assert False, "Expected ConfigurationError"
+    except ConfigurationError as exc:
+        assert "WALKINGPAD_POLLING_INTERVAL_MAX" in str(exc)
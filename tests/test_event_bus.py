@@ -5,6 +5,7 @@ import asyncio
 import pytest
 
 from miwalkingpad.event_bus import AsyncEventBus
+from miwalkingpad.types.events import DroppedEventsEvent
 
 
 @pytest.mark.asyncio
@@ -28,3 +29,49 @@ async def test_event_bus_fanout():
     await stream1.aclose()
     await stream2.aclose()
 
+
+@pytest.mark.asyncio
+async def test_event_bus_drops_oldest_when_subscriber_lags():
+    bus = AsyncEventBus(max_queue_size=2)
+    stream = bus.stream()
+
+    task = asyncio.create_task(stream.__anext__())
+    await asyncio.sleep(0)
+    await bus.publish(0)
+    assert await task == 0
+
+    for value in (1, 2, 3, 4):
+        await bus.publish(value)
+
+    dropped = await stream.__anext__()
+    assert isinstance(dropped, DroppedEventsEvent)
+    assert dropped.count == 2
+    assert await stream.__anext__() == 3
+    assert await stream.__anext__() == 4
+
+    await bus.publish(5)
+    assert await stream.__anext__() == 5
+
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_event_bus_pressure_reports_largest_backlog():
+    bus = AsyncEventBus()
+    assert bus.pressure() == 0
+    assert not bus.has_subscribers()
+
+    stream = bus.stream()
+    task = asyncio.create_task(stream.__anext__())
+    await asyncio.sleep(0)
+    await bus.publish(0)
+    await task
+
+    await bus.publish(1)
+    await bus.publish(2)
+    assert bus.has_subscribers()
+    assert bus.pressure() == 2
+
+    await stream.aclose()
+    assert bus.pressure() == 0
+    assert not bus.has_subscribers()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from miwalkingpad.interface import factory
+from miwalkingpad.interface.config import AppConfig
+from miwalkingpad.service import AsyncWalkingPadService
+
+
+def _poll_task_running() -> bool:
+    return any(task.get_name() == "walkingpad-poll" for task in asyncio.all_tasks())
+
+
+@pytest.mark.asyncio
+async def test_reset_service_closes_previous_instance(monkeypatch, fake_adapter):
+    def _create_service(config: AppConfig | None = None):
+        config = AppConfig(walkingpad_ip="192.168.1.10", walkingpad_token="abc123")
+        return config, AsyncWalkingPadService(adapter=fake_adapter)
+
+    monkeypatch.setattr(factory, "create_service", _create_service)
+    factory.get_service.cache_clear()
+
+    _, first = factory.get_service()
+    assert factory.get_service()[1] is first
+    await first.start_polling(interval_seconds=0.01)
+    assert _poll_task_running()
+
+    await factory.reset_service()
+
+    with pytest.raises(RuntimeError):
+        await first.get_status()
+    assert not _poll_task_running()
+
+    _, second = factory.get_service()
+    assert second is not first
+    await factory.reset_service()
+    await factory.reset_service()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from miio import DeviceError, DeviceException
+
+from miwalkingpad.miio_adapter import WalkingPadAdapter
+from miwalkingpad.types.errors import DeviceCommunicationError
+from miwalkingpad.types.models import PadMode, PadSensitivity
+
+
+def test_map_status_full_payload():
+    raw = {
+        "cal": 6130,
+        "dist": 90,
+        "mode": 1,
+        "power": "on",
+        "sensitivity": 2,
+        "sp": 3.0,
+        "start_speed": 2.5,
+        "step": 180,
+        "time": 121,
+    }
+
+    status = WalkingPadAdapter._map_status(raw)
+
+    assert status.is_on is True
+    assert status.mode == PadMode.MANUAL
+    assert status.sensitivity == PadSensitivity.MEDIUM
+    assert status.speed_kmh == 3.0
+    assert status.start_speed_kmh == 2.5
+    assert status.step_count == 180
+    assert status.distance_m == 90
+    assert status.calories == 6130
+    assert status.walking_time == timedelta(seconds=121)
+
+
+def test_map_status_quick_payload_with_unknown_mode():
+    raw = {"mode": 9, "sp": 0.0, "step": 0, "dist": 0, "cal": 0, "time": 0}
+
+    status = WalkingPadAdapter._map_status(raw)
+
+    assert status.is_on is None
+    assert status.power is None
+    assert status.mode is None
+    assert status.sensitivity is None
+    assert status.start_speed_kmh is None
+    assert status.speed_kmh == 0.0
+
+
+class FakeDevice:
+    def __init__(self, *, batched: bool, batch_error: Exception | None = None) -> None:
+        self.batched = batched
+        self.batch_error = batch_error
+        self.calls: list[list[str]] = []
+
+    def send(self, command: str, params: list[str]) -> list[object]:
+        assert command == "get_prop"
+        self.calls.append(params)
+        if params == ["all"]:
+            return ["mode:1", "time:121", "sp:3.0", "dist:90", "cal:6130", "step:180", "x:1"]
+        if len(params) > 1 and self.batch_error is not None:
+            raise self.batch_error
+        extra = {"power": "on", "mode": 1, "start_speed": 2.5, "sensitivity": 2}
+        if not self.batched:
+            params = params[:1]
+        return [extra[p] for p in params]
+
+
+def _adapter_with(device: FakeDevice) -> WalkingPadAdapter:
+    adapter = WalkingPadAdapter(ip="127.0.0.1", token="0" * 32, model="ksmb.walkingpad.v1")
+    adapter._device = device
+    return adapter
+
+
+def test_status_uses_batched_extra_props_when_supported():
+    device = FakeDevice(batched=True)
+    adapter = _adapter_with(device)
+
+    status = adapter.status()
+    adapter.status(max_age=0)
+
+    assert status.power == "on"
+    assert status.start_speed_kmh == 2.5
+    assert status.step_count == 180
+    assert len(device.calls) == 4
+
+
+def test_status_falls_back_to_single_props_and_remembers():
+    device = FakeDevice(batched=False)
+    adapter = _adapter_with(device)
+
+    status = adapter.status()
+    device.calls.clear()
+    adapter.status(max_age=0)
+
+    assert status.sensitivity == PadSensitivity.MEDIUM
+    assert len(device.calls) == 5
+
+
+def test_status_falls_back_when_device_rejects_batched_props():
+    device = FakeDevice(batched=True, batch_error=DeviceError({"code": -5001}))
+    adapter = _adapter_with(device)
+
+    status = adapter.status()
+
+    assert status.power == "on"
+    assert adapter._batched_props is False
+
+
+def test_status_timeout_during_batch_probe_is_not_remembered():
+    device = FakeDevice(batched=True, batch_error=DeviceException("No response from the device"))
+    adapter = _adapter_with(device)
+
+    with pytest.raises(DeviceCommunicationError):
+        adapter.status()
+
+    assert adapter._batched_props is None
+    assert len(device.calls) == 2
+
+
+def test_status_reuses_recent_read_until_command():
+    device = FakeDevice(batched=True)
+    adapter = _adapter_with(device)
+
+    first = adapter.status()
+    assert adapter.status(quick=True) is first
+    assert len(device.calls) == 2
+
+    adapter._run_command("stop", lambda: None)
+    assert adapter.status() is not first
+    assert len(device.calls) == 4
+
+
+def test_warmup_maps_handshake_failure():
+    device = FakeDevice(batched=True)
+
+    def _fail() -> None:
+        raise DeviceException("Unable to discover the device")
+
+    device.send_handshake = _fail
+    adapter = _adapter_with(device)
+
+    with pytest.raises(DeviceCommunicationError):
+        adapter.warmup()
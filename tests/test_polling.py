@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from miwalkingpad import polling
+from miwalkingpad.polling import PollScheduler
+from miwalkingpad.types.models import PadMode, PadSensitivity, PadStatus
+
+
+def _status(speed_kmh: float, step_count: int = 10) -> PadStatus:
+    return PadStatus(
+        is_on=True,
+        power="on",
+        mode=PadMode.MANUAL,
+        speed_kmh=speed_kmh,
+        start_speed_kmh=2.0,
+        sensitivity=PadSensitivity.MEDIUM,
+        step_count=step_count,
+        distance_m=12,
+        calories=3,
+        walking_time=timedelta(seconds=5),
+    )
+
+
+def test_poll_scheduler_defaults_back_off_to_five_seconds():
+    scheduler = PollScheduler(1.0)
+    intervals = [scheduler.next_interval(_status(3.0)) for _ in range(8)]
+    assert intervals[:4] == [1.0, 1.0, 1.5, 2.25]
+    assert intervals[-1] == 5.0
+
+
+def test_poll_scheduler_fixed_when_bounds_equal_base():
+    scheduler = PollScheduler(1.0, min_interval=1.0, max_interval=1.0)
+    assert [scheduler.next_interval(_status(3.0)) for _ in range(3)] == [1.0, 1.0, 1.0]
+
+
+def test_poll_scheduler_honors_explicit_bounds():
+    scheduler = PollScheduler(1.0, min_interval=2.0)
+    assert (scheduler.min_interval, scheduler.max_interval) == (2.0, 5.0)
+
+    scheduler = PollScheduler(1.0, min_interval=0.5, max_interval=0.8)
+    assert (scheduler.min_interval, scheduler.max_interval) == (0.5, 0.8)
+
+    with pytest.raises(ValueError):
+        PollScheduler(1.0, max_interval=0.8)
+
+
+def test_poll_scheduler_backs_off_while_stable_and_resets_on_change():
+    scheduler = PollScheduler(1.0, min_interval=0.5, max_interval=4.0, backoff=2.0)
+
+    assert scheduler.next_interval(_status(3.0)) == 0.5
+    assert scheduler.next_interval(_status(3.0)) == 0.5
+    assert scheduler.next_interval(_status(3.0)) == 1.0
+    assert scheduler.next_interval(_status(3.0)) == 2.0
+    assert scheduler.next_interval(_status(3.0)) == 4.0
+    assert scheduler.next_interval(_status(3.0)) == 4.0
+
+    assert scheduler.next_interval(_status(3.5)) == 0.5
+
+
+def test_poll_scheduler_record_command_resets_backoff():
+    scheduler = PollScheduler(1.0, min_interval=0.5, max_interval=4.0)
+    for _ in range(4):
+        scheduler.next_interval(_status(3.0))
+
+    scheduler.record_command()
+
+    assert scheduler.next_interval(None) == 0.5
+
+
+def test_poll_scheduler_backs_off_to_maximum_after_a_walk(monkeypatch: pytest.MonkeyPatch):
+    now = 0.0
+    monkeypatch.setattr(polling, "monotonic", lambda: now)
+    scheduler = PollScheduler(1.0)
+
+    for steps in range(30):
+        now += scheduler.next_interval(_status(3.0, step_count=steps))
+
+    idle = []
+    for _ in range(10):
+        interval = scheduler.next_interval(_status(3.0, step_count=29))
+        idle.append(interval)
+        now += interval
+
+    assert idle[-1] == 5.0
@@ -1,77 +1,125 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+import time
+from itertools import pairwise
 
 import pytest
 
 from miwalkingpad.service import AsyncWalkingPadService
-from miwalkingpad.types.models import CommandResult, PadMode, PadSensitivity, PadStatus
+from miwalkingpad.types.models import PadMode
 
 
-class FakeAdapter:
-    model = "ksmb.walkingpad.v1"
-    supported_models = ("ksmb.walkingpad.v1",)
+@pytest.mark.asyncio
+async def test_get_status_and_latest_snapshot(fake_adapter):
+    service = AsyncWalkingPadService(adapter=fake_adapter)
+    status = await service.get_status()
+    assert status.is_on is True
+    assert service.latest_status == status
 
-    def status(self, *, quick: bool = False) -> PadStatus:
-        return PadStatus(
-            is_on=True,
-            power="on",
-            mode=PadMode.MANUAL,
-            speed_kmh=3.0,
-            start_speed_kmh=2.0,
-            sensitivity=PadSensitivity.MEDIUM,
-            step_count=10,
-            distance_m=12,
-            calories=3,
-            walking_time=timedelta(seconds=5),
-        )
 
-    def start(self) -> CommandResult:
-        return CommandResult(command="start", success=True, message="ok")
+@pytest.mark.asyncio
+async def test_start_polling_updates_snapshot(fake_adapter):
+    service = AsyncWalkingPadService(adapter=fake_adapter)
+    await service.start_polling(interval_seconds=0.01)
+    await asyncio.sleep(0.03)
+    await service.stop_polling()
+    assert service.latest_status is not None
+    assert service.latest_status.mode == PadMode.MANUAL
 
-    def stop(self) -> CommandResult:
-        return CommandResult(command="stop", success=True, message="ok")
 
-    def power_on(self) -> CommandResult:
-        return CommandResult(command="power_on", success=True, message="ok")
+@pytest.mark.asyncio
+async def test_command_wakes_backed_off_poller(fake_adapter):
+    service = AsyncWalkingPadService(adapter=fake_adapter)
+    await service.start_polling(0.05, max_interval_seconds=2.0)
+    # Long enough for the idle back-off to exceed the wait below.
+    await asyncio.sleep(0.8)
+
+    await service.start()
+    issued = time.monotonic()
+    await asyncio.sleep(0.15)
+    await service.stop_polling()
 
-    def power_off(self) -> CommandResult:
-        return CommandResult(command="power_off", success=True, message="ok")
+    assert any(issued <= t <= issued + 0.1 for t in fake_adapter.read_times)
 
-    def lock(self) -> CommandResult:
-        return CommandResult(command="lock", success=True, message="ok")
 
-    def unlock(self) -> CommandResult:
-        return CommandResult(command="unlock", success=True, message="ok")
+def _gaps_after(read_times: list[float], since: float) -> list[float]:
+    reads = [t for t in read_times if t >= since]
+    return [later - earlier for earlier, later in pairwise(reads)]
 
-    def set_speed(self, _: float) -> CommandResult:
-        return CommandResult(command="set_speed", success=True, message="ok")
 
-    def set_start_speed(self, _: float) -> CommandResult:
-        return CommandResult(command="set_start_speed", success=True, message="ok")
+@pytest.mark.asyncio
+async def test_polling_returns_to_min_interval_after_command_and_state_change(fake_adapter):
+    service = AsyncWalkingPadService(adapter=fake_adapter)
+    await service.start_polling(0.05, max_interval_seconds=2.0)
+    await asyncio.sleep(0.8)
+
+    await service.start()
+    issued = time.monotonic()
+    await asyncio.sleep(0.2)
+    # The woken read, then polling at the minimum interval before backing off again.
+    assert _gaps_after(fake_adapter.read_times, issued)[0] < 0.1
+
+    await asyncio.sleep(0.6)
+    fake_adapter.speed_kmh = 3.5
+    changed = time.monotonic()
+    await asyncio.sleep(1.0)
+    await service.stop_polling()
 
-    def set_mode(self, _: PadMode) -> CommandResult:
-        return CommandResult(command="set_mode", success=True, message="ok")
+    # First read to observe the change, then one at the minimum interval.
+    assert _gaps_after(fake_adapter.read_times, changed)[0] < 0.1
 
-    def set_sensitivity(self, _: PadSensitivity) -> CommandResult:
-        return CommandResult(command="set_sensitivity", success=True, message="ok")
+
+@pytest.mark.asyncio
+async def test_polling_reads_quick_status_and_keeps_full_only_fields(fake_adapter):
+    fake_adapter.partial_quick_status = True
+    service = AsyncWalkingPadService(adapter=fake_adapter)
+    await service.start_polling(interval_seconds=0.005, max_interval_seconds=0.005)
+    await asyncio.sleep(0.05)
+    await service.stop_polling()
+
+    assert fake_adapter.reads[:3] == [False, True, True]
+    status = service.latest_status
+    assert status is not None
+    assert status.power == "on"
+    assert status.start_speed_kmh == 2.0
+    assert status.step_count == 20
+
+    await service.start()
+    await service.start_polling(interval_seconds=0.005, max_interval_seconds=0.005)
+    reads_before = len(fake_adapter.reads)
+    await asyncio.sleep(0.02)
+    await service.stop_polling()
+    assert fake_adapter.reads[reads_before] is False
 
 
 @pytest.mark.asyncio
-async def test_get_status_and_latest_snapshot():
-    service = AsyncWalkingPadService(adapter=FakeAdapter())
-    status = await service.get_status()
-    assert status.is_on is True
-    assert service.latest_status == status
+async def test_concurrent_get_status_shares_one_read(fake_adapter):
+    fake_adapter.read_delay = 0.02
+    service = AsyncWalkingPadService(adapter=fake_adapter)
+
+    first, second = await asyncio.gather(service.get_status(), service.get_status(quick=True))
+
+    assert first is second
+    assert len(fake_adapter.reads) == 1
+
+
+@pytest.mark.asyncio
+async def test_set_speed_debounced_sends_last_value_once(fake_adapter):
+    service = AsyncWalkingPadService(adapter=fake_adapter)
+
+    results = await asyncio.gather(
+        *(service.set_speed_debounced(speed, delay_seconds=0.01) for speed in (2.0, 2.5, 3.0))
+    )
+
+    assert fake_adapter.speeds == [3.0]
+    assert all(result.command == "set_speed" for result in results)
 
 
 @pytest.mark.asyncio
-async def test_start_polling_updates_snapshot():
-    service = AsyncWalkingPadService(adapter=FakeAdapter())
+async def test_aclose_stops_polling(fake_adapter):
+    service = AsyncWalkingPadService(adapter=fake_adapter)
     await service.start_polling(interval_seconds=0.01)
-    await asyncio.sleep(0.03)
-    await service.stop_polling()
-    assert service.latest_status is not None
-    assert service.latest_status.mode == PadMode.MANUAL
+    await service.aclose()
 
+    assert service._polling_task is None